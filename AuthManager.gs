@@ -2,6 +2,11 @@
 // AUTHMANAGER.GS - COMBINED AUTHENTICATION MANAGEMENT (OAUTH COMPLIANT)
 // ==========================================
 
+/**
+ * Two-character hex strings for every byte value, built once per execution
+ */
+const HEX_BYTE_TABLE = Array.from({ length: 256 }, (_, i) => (i + 256).toString(16).substr(-2));
+
 /**
  * Authentication management utilities - OAuth compliant with minimal scopes
  * Handles both credentials and token management with versioned caching
@@ -275,10 +280,11 @@ const AuthManager = {
       Logger.log(`Generating signature for message length: ${message.length}, clientSecret length: ${clientSecret.length}`);
 
       const signature = Utilities.computeHmacSha256Signature(message, clientSecret);
-      const hexSignature = signature.map(byte => {
-        const hex = (byte + 256).toString(16).substr(-2);
-        return hex;
-      }).join('');
+      // Signature bytes are signed (-128..127); mask to index the hex table
+      let hexSignature = '';
+      for (let i = 0; i < signature.length; i++) {
+        hexSignature += HEX_BYTE_TABLE[signature[i] & 0xff];
+      }
 
       return hexSignature;
     } catch (error) {
@@ -306,7 +312,8 @@ const AuthManager = {
       }
 
       const credentials = credResult.credentials;
-      const currentVersion = this.getCurrentCredentialVersion();
+      // Read the version from the credentials already in hand (same default as getCurrentCredentialVersion)
+      const currentVersion = credentials.credentialVersion || 1;
 
       // Check for cached token if not forcing refresh
       if (!forceRefresh) {
@@ -339,14 +346,20 @@ const AuthManager = {
    */
   getValidVersionedToken(currentVersion) {
     try {
-      const documentProperties = PropertiesService.getDocumentProperties();
-      const cachedTokenStr = documentProperties.getProperty('zotoks_cached_token');
+      // Memory first - avoids a property read and JSON.parse per API call
+      let cachedToken = PerformanceCache.getCachedToken();
 
-      if (!cachedTokenStr) {
-        return null;
-      }
+      if (!cachedToken) {
+        const documentProperties = PropertiesService.getDocumentProperties();
+        const cachedTokenStr = documentProperties.getProperty('zotoks_cached_token');
 
-      const cachedToken = JSON.parse(cachedTokenStr);
+        if (!cachedTokenStr) {
+          return null;
+        }
+
+        cachedToken = JSON.parse(cachedTokenStr);
+        PerformanceCache.setCachedToken(cachedToken);
+      }
 
       // Check version compatibility
       if (cachedToken.credentialVersion !== currentVersion) {
@@ -403,22 +416,22 @@ const AuthManager = {
 
       // Make API request for token
       const loginUrl = Config.getLoginUrl();
-      const response = UrlFetchApp.fetch(loginUrl, {
-        method: 'POST',
-        headers: {
-          'Content-Type': 'application/json'
+      const responseData = HttpClient.fetchWithRetry(
+        loginUrl,
+        {
+          method: 'POST',
+          headers: JSON_HEADERS,
+          payload: JSON.stringify(loginData)
         },
-        payload: JSON.stringify(loginData),
-        muteHttpExceptions: true,
-        timeout: Config.getTimeout()
-      });
-
-      const statusCode = response.getResponseCode();
-      if (statusCode !== 200 && statusCode !== 201) {
-        throw new Error(`Authentication failed: HTTP ${statusCode}`);
-      }
-
-      const responseData = JSON.parse(response.getContentText());
+        (response) => {
+          const statusCode = response.getResponseCode();
+          if (statusCode !== 200 && statusCode !== 201) {
+            throw new Error(`Authentication failed: HTTP ${statusCode}`);
+          }
+          return JSON.parse(response.getContentText());
+        },
+        'Login'
+      );
 
       if (!responseData.token) {
         throw new Error('No token received from authentication server');
@@ -438,6 +451,7 @@ const AuthManager = {
       // Cache the token
       const documentProperties = PropertiesService.getDocumentProperties();
       documentProperties.setProperty('zotoks_cached_token', JSON.stringify(tokenData));
+      PerformanceCache.setCachedToken(tokenData);
 
       Logger.log(`✅ Fresh token generated and cached (expires: ${tokenData.expiresAt})`);
 
@@ -464,6 +478,7 @@ const AuthManager = {
    */
   clearTokenCache() {
     try {
+      PerformanceCache.clearCachedToken();
       const documentProperties = PropertiesService.getDocumentProperties();
       documentProperties.deleteProperty('zotoks_cached_token');
       Logger.log('🧹 Token cache cleared');
@@ -75,6 +75,7 @@ const ZOTOKS_CONFIG = {
     MAX_PAGES_PER_BATCH: 50, // Maximum pages to fetch in one execution
     PAGE_PROCESSING_DELAY: 100, // Milliseconds delay between page requests
     TIMEOUT_CHECK_FREQUENCY: 5, // Check timeout every N pages
+    MAX_PARALLEL_REQUESTS: 10, // Upper bound on pages fetched at once with UrlFetchApp.fetchAll
 
     // Batch processing settings
     BATCH_SIZE: 2000, // Records per batch operation
@@ -85,7 +86,10 @@ const ZOTOKS_CONFIG = {
 
     // Retry configuration
     MAX_RETRIES: 3,
-    RETRY_DELAY: 1000, // Milliseconds between retries
+    RETRY_DELAY: 1000, // Base backoff in milliseconds, doubled per attempt
+    MAX_RETRY_DELAY: 8000, // Backoff cap in milliseconds
+    CIRCUIT_FAILURE_THRESHOLD: 5, // Consecutive transient failures before requests fail fast
+    CIRCUIT_RECOVERY_TIME: 30 * 1000, // Milliseconds before a probe request is let through
     TIMEOUT: 30 // Request timeout in seconds
   },
 
@@ -135,6 +139,15 @@ const ZOTOKS_CONFIG = {
   }
 };
 
+// Endpoint definitions are shared read-only config - freeze them and list the keys once
+Object.values(ZOTOKS_CONFIG.ENDPOINTS).forEach((endpointConfig) => {
+  Object.freeze(endpointConfig.allowedTimePeriods);
+  Object.freeze(endpointConfig);
+});
+Object.freeze(ZOTOKS_CONFIG.ENDPOINTS);
+
+const ZOTOKS_ENDPOINT_KEYS = Object.freeze(Object.keys(ZOTOKS_CONFIG.ENDPOINTS));
+
 /**
  * Get Zotoks configuration with pagination, price list support, and versioned caching
  */
@@ -183,26 +196,19 @@ const Config = {
       throw new Error(`Unknown price list endpoint: ${endpoint}`);
     }
 
-    const baseUrl = ZOTOKS_CONFIG.BASE_URL;
-    let url = `${baseUrl}${config.apiPath}`;
+    let url = `${ZOTOKS_CONFIG.BASE_URL}${config.apiPath}`;
 
     // Add priceListId for items endpoint
     if (endpoint === 'pricelist-items' && params.priceListId) {
-      url += `/${params.priceListId}`;
+      url += `/${encodeURIComponent(params.priceListId)}`;
     }
 
     // Add pagination params if supported
     if (config.supportsPagination) {
-      const urlParams = [];
-      const pageSize = params.pageSize || ZOTOKS_CONFIG.PAGINATION_AND_BATCH.PAGE_SIZE;
-      urlParams.push(`pageSize=${pageSize}`);
-
-      if (params.pageNo) {
-        urlParams.push(`pageNo=${params.pageNo}`);
-      }
-      if (urlParams.length > 0) {
-        url += `?${urlParams.join('&')}`;
-      }
+      url += `?${this.toQueryString({
+        pageSize: params.pageSize || ZOTOKS_CONFIG.PAGINATION_AND_BATCH.PAGE_SIZE,
+        pageNo: params.pageNo || null
+      })}`;
     }
 
     return url;
@@ -265,6 +271,13 @@ const Config = {
     return ZOTOKS_CONFIG.PAGINATION_AND_BATCH.PAGE_PROCESSING_DELAY;
   },
 
+  /**
+   * Get maximum number of requests sent in parallel
+   */
+  getMaxParallelRequests() {
+    return ZOTOKS_CONFIG.PAGINATION_AND_BATCH.MAX_PARALLEL_REQUESTS;
+  },
+
   /**
    * Get timeout check frequency
    */
@@ -274,7 +287,7 @@ const Config = {
 
   // EXISTING METHODS (keeping all your current functionality)
   getAvailableEndpoints() {
-    return Object.keys(ZOTOKS_CONFIG.ENDPOINTS);
+    return ZOTOKS_ENDPOINT_KEYS;
   },
 
   getBaseUrl() {
@@ -301,6 +314,18 @@ const Config = {
     return ZOTOKS_CONFIG.PAGINATION_AND_BATCH.RETRY_DELAY;
   },
 
+  getMaxRetryDelay() {
+    return ZOTOKS_CONFIG.PAGINATION_AND_BATCH.MAX_RETRY_DELAY;
+  },
+
+  getCircuitFailureThreshold() {
+    return ZOTOKS_CONFIG.PAGINATION_AND_BATCH.CIRCUIT_FAILURE_THRESHOLD;
+  },
+
+  getCircuitRecoveryTime() {
+    return ZOTOKS_CONFIG.PAGINATION_AND_BATCH.CIRCUIT_RECOVERY_TIME;
+  },
+
   getBatchSize() {
     return ZOTOKS_CONFIG.PAGINATION_AND_BATCH.BATCH_SIZE;
   },
@@ -347,7 +372,22 @@ const Config = {
 
   // EXISTING UTILITY METHODS
   isValidEndpoint(endpoint) {
-    return Object.keys(ZOTOKS_CONFIG.ENDPOINTS).includes(endpoint);
+    return ZOTOKS_CONFIG.ENDPOINTS.hasOwnProperty(endpoint);
+  },
+
+  /**
+   * Check if a time period is allowed for endpoint
+   * Endpoints without time period support or restrictions accept any period
+   */
+  isAllowedTimePeriod(endpoint, period) {
+    const config = this.getEndpointConfig(endpoint);
+    if (!config) {
+      return false;
+    }
+    if (!config.supportsTimePeriod || config.allowedTimePeriods.length === 0) {
+      return true;
+    }
+    return config.allowedTimePeriods.includes(String(period));
   },
 
   convertPeriodToAPIFormat(days) {
@@ -360,7 +400,7 @@ const Config = {
    * Get endpoint configuration by endpoint key
    */
   getEndpointConfig(endpoint) {
-    return ZOTOKS_CONFIG.ENDPOINTS[endpoint] || null;
+    return this.isValidEndpoint(endpoint) ? ZOTOKS_CONFIG.ENDPOINTS[endpoint] : null;
   },
 
   /**
@@ -430,38 +470,70 @@ const Config = {
       throw new Error(`Unknown endpoint: ${endpoint}`);
     }
 
-    let url = `${ZOTOKS_CONFIG.BASE_URL}${ZOTOKS_CONFIG.DATA_ENDPOINT}/${config.apiName}`;
-    const params = [];
+    const url = `${ZOTOKS_CONFIG.BASE_URL}${ZOTOKS_CONFIG.DATA_ENDPOINT}/${config.apiName}`;
+    const params = {};
 
     // Add pagination if supported
     if (config.supportsPagination) {
       // Use provided pageSize or default
-      const pageSize = paginationParams.pageSize !== undefined
+      params.pageSize = paginationParams.pageSize !== undefined
         ? paginationParams.pageSize
         : ZOTOKS_CONFIG.PAGINATION_AND_BATCH.PAGE_SIZE;
-      params.push(`pageSize=${pageSize}`);
-
-      // Add pageNo if provided
-      if (paginationParams.pageNo !== undefined) {
-        params.push(`pageNo=${paginationParams.pageNo}`);
-      }
+      params.pageNo = paginationParams.pageNo;
     }
 
     // Add time period if supported and provided
     if (config.supportsTimePeriod && period) {
       // Validate period is allowed
-      if (config.allowedTimePeriods.length > 0 && !config.allowedTimePeriods.includes(String(period))) {
+      if (!this.isAllowedTimePeriod(endpoint, period)) {
         throw new Error(`Invalid period ${period} for endpoint ${endpoint}. Allowed: ${config.allowedTimePeriods.join(', ')}`);
       }
-      params.push(`period=${this.convertPeriodToAPIFormat(period)}`);
+      params.period = this.convertPeriodToAPIFormat(period);
     }
 
     // Add query parameters if any
-    if (params.length > 0) {
-      url += `?${params.join('&')}`;
+    const query = this.toQueryString(params);
+    return query ? `${url}?${query}` : url;
+  },
+
+  /**
+   * Encode an object as a query string ("a=1&b=2"), skipping null and undefined values
+   * Keys keep their insertion order
+   */
+  toQueryString(params) {
+    return Object.keys(params)
+      .filter(key => params[key] !== undefined && params[key] !== null)
+      .map(key => `${encodeURIComponent(key)}=${encodeURIComponent(params[key])}`)
+      .join('&');
+  },
+
+  /**
+   * Build a page URL function for a paginated endpoint
+   * Endpoint config, period validation and the fixed query parts are resolved once,
+   * so each page only adds its page number (same URLs as buildApiUrl)
+   */
+  getPageUrlBuilder(endpoint, period = null, pageSize = ZOTOKS_CONFIG.PAGINATION_AND_BATCH.PAGE_SIZE) {
+    const config = this.getEndpointConfig(endpoint);
+    if (!config) {
+      throw new Error(`Unknown endpoint: ${endpoint}`);
     }
 
-    return url;
+    if (!config.supportsPagination) {
+      const url = this.buildApiUrl(endpoint, period);
+      return () => url;
+    }
+
+    const prefix = `${ZOTOKS_CONFIG.BASE_URL}${ZOTOKS_CONFIG.DATA_ENDPOINT}/${config.apiName}?${this.toQueryString({ pageSize })}&pageNo=`;
+    let suffix = '';
+
+    if (config.supportsTimePeriod && period) {
+      if (!this.isAllowedTimePeriod(endpoint, period)) {
+        throw new Error(`Invalid period ${period} for endpoint ${endpoint}. Allowed: ${config.allowedTimePeriods.join(', ')}`);
+      }
+      suffix = `&${this.toQueryString({ period: this.convertPeriodToAPIFormat(period) })}`;
+    }
+
+    return (pageNo) => `${prefix}${pageNo}${suffix}`;
   },
 
   /**
@@ -0,0 +1,297 @@
+// ==========================================
+// HTTPCLIENT.GS - SHARED API REQUEST HANDLING
+// ==========================================
+
+/**
+ * Request headers shared by all Zotoks API calls
+ */
+const JSON_HEADERS = Object.freeze({
+  'Content-Type': 'application/json'
+});
+
+/**
+ * Browser-like headers sent with update (POST) calls
+ */
+const BROWSER_EMULATION_HEADERS = Object.freeze({
+  'User-Agent': 'Mozilla/5.0 (Macintosh; Intel Mac OS X 10_15_7) AppleWebKit/537.36 (KHTML, like Gecko) Chrome/135.0.0.0 Safari/537.36',
+  'Referer': 'https://app-qa.zono.digital/',
+  'sec-ch-ua': '"Google Chrome";v="135", "Not-A.Brand";v="8", "Chromium";v="135"',
+  'sec-ch-ua-mobile': '?0',
+  'sec-ch-ua-platform': '"macOS"'
+});
+
+/**
+ * Circuit breaker state for this execution
+ * Open (openedAt set) after repeated transient failures; requests then fail fast
+ * until the recovery time passes and one probe request is let through
+ */
+const CIRCUIT_STATE = {
+  consecutiveFailures: 0,
+  openedAt: null
+};
+
+/**
+ * Shared UrlFetchApp request loop for Zotoks API calls
+ * Retry and backoff behavior lives here instead of in every caller
+ */
+const HttpClient = {
+  /**
+   * Headers for authenticated API reads - build once per operation and reuse across pages
+   */
+  authHeaders(token) {
+    return {
+      ...JSON_HEADERS,
+      'Authorization': `Bearer ${token}`
+    };
+  },
+
+  /**
+   * Headers for authenticated update (POST) calls
+   */
+  updateHeaders(token) {
+    return {
+      ...this.authHeaders(token),
+      ...BROWSER_EMULATION_HEADERS
+    };
+  },
+
+  /**
+   * Fetch a URL, retrying transient failures with jittered exponential backoff
+   * handleResponse maps each HTTPResponse to a result or throws. A throw is retried only
+   * for network errors, 429 and 5xx responses, and only for GETs - a retried update could
+   * apply twice. Anything else is rethrown to the caller straight away
+   *
+   * @param {string} url - Request URL
+   * @param {Object} options - UrlFetchApp options (muteHttpExceptions and timeout are filled in)
+   * @param {Function} handleResponse - Called with the HTTPResponse, returns the result
+   * @param {string} label - Prefix for attempt failure log lines
+   * @param {number} firstAttempt - Attempt number to start from when earlier attempts were made elsewhere
+   * @returns {*} - Whatever handleResponse returns
+   */
+  fetchWithRetry(url, options, handleResponse, label, firstAttempt = 1) {
+    const requestOptions = {
+      muteHttpExceptions: true,
+      timeout: Config.getTimeout(),
+      ...options
+    };
+    const isGet = (requestOptions.method || 'get').toLowerCase() === 'get';
+    const maxAttempts = isGet ? Config.getMaxRetries() : 1;
+
+    for (let attempt = firstAttempt; ; attempt++) {
+      this.assertCircuitClosed();
+
+      let response = null;
+      try {
+        response = UrlFetchApp.fetch(url, requestOptions);
+        this.recordOutcome(response);
+        return handleResponse(response);
+      } catch (error) {
+        Logger.log(`${label} attempt ${attempt} failed: ${error.message}`);
+        if (!response) {
+          this.recordOutcome(null);
+        }
+
+        if (attempt >= maxAttempts || !this.isTransientFailure(response)) {
+          throw error;
+        }
+        Utilities.sleep(this.backoffDelay(attempt));
+      }
+    }
+  },
+
+  /**
+   * A failure is transient when no response came back (network error or timeout)
+   * or the server answered 429 or 5xx
+   */
+  isTransientFailure(response) {
+    if (!response) {
+      return true;
+    }
+    const responseCode = response.getResponseCode();
+    return responseCode === 429 || responseCode >= 500;
+  },
+
+  /**
+   * Throw instead of sending a request while the circuit is open
+   * Once the recovery time has passed the request goes through as a probe
+   */
+  assertCircuitClosed() {
+    if (CIRCUIT_STATE.openedAt === null) {
+      return;
+    }
+    if (Date.now() - CIRCUIT_STATE.openedAt < Config.getCircuitRecoveryTime()) {
+      throw new Error(`Zotoks API unavailable after ${CIRCUIT_STATE.consecutiveFailures} consecutive failures - try again shortly`);
+    }
+    Logger.log('🔌 Circuit recovery time passed - sending probe request');
+  },
+
+  /**
+   * Track consecutive transient failures; any other response means the API is reachable
+   */
+  recordOutcome(response) {
+    if (!this.isTransientFailure(response)) {
+      CIRCUIT_STATE.consecutiveFailures = 0;
+      CIRCUIT_STATE.openedAt = null;
+      return;
+    }
+
+    CIRCUIT_STATE.consecutiveFailures++;
+    if (CIRCUIT_STATE.consecutiveFailures >= Config.getCircuitFailureThreshold()) {
+      if (CIRCUIT_STATE.openedAt === null) {
+        Logger.log(`🔌 Circuit opened after ${CIRCUIT_STATE.consecutiveFailures} consecutive failures`);
+      }
+      CIRCUIT_STATE.openedAt = Date.now();
+    }
+  },
+
+  /**
+   * Full jitter: a random wait up to the capped exponential backoff for this attempt,
+   * so retries from parallel pages don't hit the API in lockstep
+   */
+  backoffDelay(attempt) {
+    const ceiling = Math.min(
+      Config.getMaxRetryDelay(),
+      Config.getRetryDelay() * Math.pow(2, attempt - 1)
+    );
+    return Math.floor(Math.random() * ceiling);
+  },
+
+  /**
+   * Fetch several GET URLs in one parallel UrlFetchApp.fetchAll call
+   * Returns one reader per URL. Calling a reader handles that URL's batched response;
+   * the batched request counts as attempt 1, and a transient failure continues in
+   * fetchWithRetry from attempt 2. Read in order and stop early to leave responses
+   * past the end of the data unhandled.
+   *
+   * @param {string[]} urls - Request URLs
+   * @param {Object} options - UrlFetchApp options shared by every request
+   * @param {Function} handleResponse - Called with (HTTPResponse, index), returns the result
+   * @param {string[]} labels - Log prefix for each URL
+   * @returns {Function[]} - Readers returning whatever handleResponse returns
+   */
+  fetchBatch(urls, options, handleResponse, labels) {
+    this.assertCircuitClosed();
+
+    let responses = null;
+    let batchError = null;
+    try {
+      responses = UrlFetchApp.fetchAll(urls.map(url => ({
+        url,
+        muteHttpExceptions: true,
+        ...options
+      })));
+    } catch (error) {
+      Logger.log(`${labels[0]}-${labels[labels.length - 1]} batch failed: ${error.message}`);
+      this.recordOutcome(null);
+      batchError = error;
+    }
+
+    return urls.map((url, index) => () => {
+      const handle = (response) => handleResponse(response, index);
+      let error = batchError;
+
+      if (responses) {
+        this.recordOutcome(responses[index]);
+        try {
+          return handle(responses[index]);
+        } catch (handleError) {
+          Logger.log(`${labels[index]} attempt 1 failed: ${handleError.message}`);
+          if (!this.isTransientFailure(responses[index])) {
+            throw handleError;
+          }
+          error = handleError;
+        }
+      }
+
+      if (Config.getMaxRetries() < 2) {
+        throw error;
+      }
+      Utilities.sleep(this.backoffDelay(1));
+      return this.fetchWithRetry(url, options, handle, labels[index], 2);
+    });
+  },
+
+  /**
+   * Fetch consecutive pages in parallel batches, in page order
+   * By default batches grow 1, 2, 4, ... up to MAX_PARALLEL_REQUESTS, so a short result costs
+   * only a few requests while a long one still reaches full parallelism; callers expecting
+   * many pages can start higher with initialBatchSize. Pagination ends at the
+   * first page shorter than pageSize or the first page handleResponse maps to null.
+   *
+   * @param {Function} buildPageUrl - Page number -> request URL
+   * @param {Object} options - UrlFetchApp options shared by every page
+   * @param {Function} handleResponse - Called with (HTTPResponse, pageNo); returns the page's
+   *   records, null for end of data, or throws to fail the whole fetch
+   * @param {Object} limits - pageSize, plus optional maxPages, maxRecords, deadline (epoch ms)
+   *   and initialBatchSize (default 1)
+   * @returns {Object} - { data, pagesRead, stopReason } with stopReason one of
+   *   'end', 'maxPages', 'maxRecords' or 'deadline'
+   */
+  fetchPages(buildPageUrl, options, handleResponse, limits) {
+    const {
+      pageSize,
+      maxPages = Infinity,
+      maxRecords = Infinity,
+      deadline = null,
+      initialBatchSize = 1
+    } = limits;
+    const maxParallel = Config.getMaxParallelRequests();
+    const data = [];
+    let page = 1;
+    let batchSize = Math.min(initialBatchSize, maxParallel);
+    let stopReason = null;
+
+    while (!stopReason) {
+      if (page > maxPages) {
+        stopReason = 'maxPages';
+        break;
+      }
+      if (data.length >= maxRecords) {
+        stopReason = 'maxRecords';
+        break;
+      }
+      if (deadline && Date.now() > deadline) {
+        stopReason = 'deadline';
+        break;
+      }
+
+      const lastPage = Math.min(page + batchSize - 1, maxPages);
+      const pageNumbers = [];
+      for (let pageNo = page; pageNo <= lastPage; pageNo++) {
+        pageNumbers.push(pageNo);
+      }
+      Logger.log(`🚀 Fetching pages ${page}-${lastPage}`);
+
+      const readPages = this.fetchBatch(
+        pageNumbers.map(buildPageUrl),
+        options,
+        (response, index) => handleResponse(response, pageNumbers[index]),
+        pageNumbers.map(pageNo => `Page ${pageNo}`)
+      );
+
+      for (let i = 0; i < readPages.length && !stopReason; i++) {
+        const records = readPages[i]();
+        if (records === null) {
+          stopReason = 'end';
+          break;
+        }
+
+        data.push(...records);
+        Logger.log(`📋 Page ${page}: ${records.length} records (total: ${data.length})`);
+        page++;
+
+        if (records.length < pageSize) {
+          stopReason = 'end';
+        }
+      }
+
+      if (!stopReason) {
+        batchSize = Math.min(batchSize * 2, maxParallel);
+        // Small delay between batches
+        Utilities.sleep(Config.getPageProcessingDelay());
+      }
+    }
+
+    return { data, pagesRead: page - 1, stopReason };
+  }
+};
@@ -82,21 +82,20 @@ const ImportDialog = {
 
       Logger.log(`✅ API returned ${data.length} records`);
 
-      // Flatten nested structures for all rows
-      const flattenedData = data.map((row) => {
-        const flatRow = {};
-        Object.keys(row).forEach((key) => {
-          flatRow[key] =
-            row[key] !== null && typeof row[key] === "object"
-              ? this.flattenForCell(row[key])
-              : row[key];
-        });
-        return flatRow;
+      // Flatten nested structures in place - rows come straight from
+      // JSON.parse and are not shared, so copying each row is wasted work
+      data.forEach((row) => {
+        for (const key in row) {
+          const value = row[key];
+          if (value !== null && typeof value === "object") {
+            row[key] = this.flattenForCell(value);
+          }
+        }
       });
 
       return {
         success: true,
-        data: flattenedData,
+        data: data,
         headers: headers,
       };
     } catch (error) {
@@ -136,18 +135,15 @@ const ImportDialog = {
         Logger.log(`Fetching data for ${endpoint} (no pagination)`);
       }
 
-      for (let attempt = 1; attempt <= Config.getMaxRetries(); attempt++) {
-        try {
-          const response = UrlFetchApp.fetch(dataUrl, {
-            method: "GET",
-            headers: {
-              "Content-Type": "application/json",
-              Authorization: `Bearer ${token}`,
-            },
-            muteHttpExceptions: true,
-            timeout: Config.getTimeout(),
-          });
+      const requestOptions = {
+        method: "GET",
+        headers: HttpClient.authHeaders(token),
+      };
 
+      return HttpClient.fetchWithRetry(
+        dataUrl,
+        requestOptions,
+        (response) => {
           const responseCode = response.getResponseCode();
           const responseText = response.getContentText();
 
@@ -181,12 +177,12 @@ const ImportDialog = {
           } else if (responseCode === 401) {
             // Authentication failed
             throw new Error(
-              `Authentication failed for page ${page} (${responseCode}): ${responseText}`,
+              `Authentication failed for page ${page} (${responseCode}): ${Utils.truncateText(responseText)}`,
             );
           } else if (responseCode === 400) {
             // Bad request - might be end of data or invalid page
             Logger.log(
-              `Page ${page} returned 400 - might be end of data: ${responseText}`,
+              `Page ${page} returned 400 - might be end of data: ${Utils.truncateText(responseText)}`,
             );
             return {
               success: true,
@@ -198,21 +194,12 @@ const ImportDialog = {
             };
           } else {
             throw new Error(
-              `API request failed for page ${page} (${responseCode}): ${responseText}`,
+              `API request failed for page ${page} (${responseCode}): ${Utils.truncateText(responseText)}`,
             );
           }
-        } catch (error) {
-          Logger.log(
-            `Page ${page} attempt ${attempt} failed: ${error.message}`,
-          );
-
-          if (attempt < Config.getMaxRetries()) {
-            Utilities.sleep(Config.getRetryDelay() * Math.pow(2, attempt - 1));
-          } else {
-            throw error;
-          }
-        }
-      }
+        },
+        `Page ${page}`,
+      );
     } catch (error) {
       Logger.log(`Error fetching page ${page}: ${error.message}`);
       return {
@@ -243,16 +230,11 @@ const ImportDialog = {
       const endpointConfig = Config.getEndpointConfig(endpoint);
 
       // Validate period if endpoint supports time period
-      if (endpointConfig.supportsTimePeriod && period) {
-        if (
-          endpointConfig.allowedTimePeriods.length > 0 &&
-          !endpointConfig.allowedTimePeriods.includes(String(period))
-        ) {
-          return {
-            success: false,
-            message: `Invalid period ${period} for endpoint ${endpoint}. Allowed periods: ${endpointConfig.allowedTimePeriods.join(", ")}`,
-          };
-        }
+      if (period && !Config.isAllowedTimePeriod(endpoint, period)) {
+        return {
+          success: false,
+          message: `Invalid period ${period} for endpoint ${endpoint}. Allowed periods: ${endpointConfig.allowedTimePeriods.join(", ")}`,
+        };
       }
 
       // Get token using centralized auth
@@ -279,52 +261,50 @@ const ImportDialog = {
           pageNo: 1,
         });
 
-        const response = UrlFetchApp.fetch(dataUrl, {
-          method: "GET",
-          headers: {
-            "Content-Type": "application/json",
-            Authorization: `Bearer ${token}`,
-          },
-          muteHttpExceptions: true,
-          timeout: Config.getTimeout(),
-        });
-
-        const responseCode = response.getResponseCode();
-        const responseText = response.getContentText();
+        return HttpClient.fetchWithRetry(
+          dataUrl,
+          { method: "GET", headers: HttpClient.authHeaders(token) },
+          (response) => {
+            const responseCode = response.getResponseCode();
+            const responseText = response.getContentText();
 
-        if (responseCode >= 200 && responseCode < 300) {
-          const rawApiResponse = JSON.parse(responseText);
-          const transformResult = this.transformApiResponse(rawApiResponse);
+            if (responseCode >= 200 && responseCode < 300) {
+              const rawApiResponse = JSON.parse(responseText);
+              const transformResult =
+                this.transformApiResponse(rawApiResponse);
 
-          if (!transformResult.success) {
-            throw new Error(
-              `Failed to transform preview data: ${transformResult.error}`,
-            );
-          }
+              if (!transformResult.success) {
+                throw new Error(
+                  `Failed to transform preview data: ${transformResult.error}`,
+                );
+              }
 
-          Logger.log(
-            `✅ Preview fetched: ${transformResult.data.length} records`,
-          );
+              Logger.log(
+                `✅ Preview fetched: ${transformResult.data.length} records`,
+              );
 
-          return {
-            success: true,
-            data: transformResult.data,
-            headers: transformResult.headers,
-            recordCount: transformResult.data.length,
-            endpoint: endpoint,
-            period: period,
-            fetchedAt: new Date().toISOString(),
-            isPreview: true,
-          };
-        } else if (responseCode === 401) {
-          throw new Error(
-            `Authentication failed (${responseCode}): ${responseText}`,
-          );
-        } else {
-          throw new Error(
-            `Preview API request failed (${responseCode}): ${responseText}`,
-          );
-        }
+              return {
+                success: true,
+                data: transformResult.data,
+                headers: transformResult.headers,
+                recordCount: transformResult.data.length,
+                endpoint: endpoint,
+                period: period,
+                fetchedAt: new Date().toISOString(),
+                isPreview: true,
+              };
+            } else if (responseCode === 401) {
+              throw new Error(
+                `Authentication failed (${responseCode}): ${Utils.truncateText(responseText)}`,
+              );
+            } else {
+              throw new Error(
+                `Preview API request failed (${responseCode}): ${Utils.truncateText(responseText)}`,
+              );
+            }
+          },
+          "Preview",
+        );
       } else {
         // Non-paginated endpoint - fetch all data (assumed to be small dataset)
         Logger.log(`📄 Non-paginated endpoint - fetching all data`);
@@ -383,16 +363,11 @@ const ImportDialog = {
       }
 
       // Validate period for endpoints that support time periods
-      if (
-        endpointConfig.supportsTimePeriod &&
-        endpointConfig.allowedTimePeriods.length > 0
-      ) {
-        if (!endpointConfig.allowedTimePeriods.includes(String(period))) {
-          return {
-            success: false,
-            message: `Invalid period ${period} for endpoint ${endpoint}. Allowed periods: ${endpointConfig.allowedTimePeriods.join(", ")}`,
-          };
-        }
+      if (!Config.isAllowedTimePeriod(endpoint, period)) {
+        return {
+          success: false,
+          message: `Invalid period ${period} for endpoint ${endpoint}. Allowed periods: ${endpointConfig.allowedTimePeriods.join(", ")}`,
+        };
       }
 
       Logger.log(
@@ -421,74 +396,17 @@ const ImportDialog = {
       const maxPages = Config.getMaxPagesPerBatch();
       const memoryLimit = Config.getMemoryLimit();
 
-      // Initialize all variables that will be used across scopes
-      let hasNextPage = false;
-      let page = 1;
-
       if (endpointConfig.supportsPagination) {
         // PAGINATED ENDPOINTS: Use parallel batch fetching
-        hasNextPage = true;
-
         Logger.log(
           `📏 Pagination limits: ${maxPages} max pages, ${memoryLimit} max records, ${maxExecutionTime}ms max time`,
         );
 
-        const batchSize = 10; // Fetch 10 pages in parallel per batch
         const pageSize = Config.getPageSize();
-
-        // Parallel pagination loop
-        while (
-          hasNextPage &&
-          pagesProcessed < maxPages &&
-          totalRecords < memoryLimit
-        ) {
-          // Check execution time
-          const elapsedTime = Date.now() - startTime;
-          if (elapsedTime > maxExecutionTime) {
-            Logger.log(
-              `⏰ Stopping due to time limit (${elapsedTime}ms > ${maxExecutionTime}ms)`,
-            );
-            break;
-          }
-
-          // Determine how many pages to fetch in this batch
-          const remainingPages = maxPages - pagesProcessed;
-          const pagesToFetch = Math.min(batchSize, remainingPages);
-
-          // Build parallel requests for this batch
-          const requests = [];
-          for (let i = 0; i < pagesToFetch; i++) {
-            const currentPage = page + i;
-            const dataUrl = Config.buildApiUrl(endpoint, period, {
-              pageSize: pageSize,
-              pageNo: currentPage,
-            });
-
-            requests.push({
-              url: dataUrl,
-              method: "GET",
-              headers: {
-                "Content-Type": "application/json",
-                Authorization: `Bearer ${token}`,
-              },
-              muteHttpExceptions: true,
-            });
-          }
-
-          Logger.log(
-            `🚀 Fetching pages ${page}-${page + pagesToFetch - 1} in parallel (batch of ${pagesToFetch})`,
-          );
-
-          // Execute parallel requests
-          const responses = UrlFetchApp.fetchAll(requests);
-
-          // Process all responses
-          let batchHasData = false;
-          let shouldStopPagination = false;
-
-          for (let i = 0; i < responses.length; i++) {
-            const response = responses[i];
-            const currentPage = page + i;
+        const pages = HttpClient.fetchPages(
+          Config.getPageUrlBuilder(endpoint, period, pageSize),
+          { method: "GET", headers: HttpClient.authHeaders(token) },
+          (response, pageNo) => {
             const responseCode = response.getResponseCode();
             const responseText = response.getContentText();
 
@@ -497,56 +415,42 @@ const ImportDialog = {
               const transformResult = this.transformApiResponse(rawApiResponse);
 
               if (!transformResult.success) {
-                Logger.log(
-                  `⚠️ Page ${currentPage} transform failed: ${transformResult.error}`,
-                );
-                continue;
-              }
-
-              const pageData = transformResult.data;
-
-              if (pageData && pageData.length > 0) {
-                allData = allData.concat(pageData);
-                totalRecords += pageData.length;
-                batchHasData = true;
-                Logger.log(
-                  `📊 Page ${currentPage}: ${pageData.length} records (total: ${totalRecords})`,
-                );
-
-                // If this page has fewer records than pageSize, it's the last page
-                if (pageData.length < pageSize) {
-                  Logger.log(
-                    `📄 Page ${currentPage} has fewer records than pageSize (${pageData.length} < ${pageSize}), stopping pagination`,
-                  );
-                  shouldStopPagination = true;
-                  break; // Stop processing remaining pages in batch
-                }
-              } else {
-                Logger.log(
-                  `📄 Page ${currentPage}: No data, stopping pagination`,
+                throw new Error(
+                  `Failed to transform API response for page ${pageNo}: ${transformResult.error}`,
                 );
-                shouldStopPagination = true;
-                break; // Stop processing remaining pages in batch
               }
+              return transformResult.data || [];
             } else if (responseCode === 400) {
-              Logger.log(`📄 Page ${currentPage} returned 400 - end of data`);
-              shouldStopPagination = true;
-              break;
+              Logger.log(`📄 Page ${pageNo} returned 400 - end of data`);
+              return null;
+            } else if (responseCode === 401) {
+              throw new Error(
+                `Authentication failed for page ${pageNo} (${responseCode}): ${Utils.truncateText(responseText)}`,
+              );
             } else {
-              Logger.log(
-                `⚠️ Page ${currentPage} failed (${responseCode}): ${responseText.substring(0, 100)}`,
+              throw new Error(
+                `API request failed for page ${pageNo} (${responseCode}): ${Utils.truncateText(responseText)}`,
               );
             }
-          }
+          },
+          {
+            pageSize,
+            maxPages,
+            maxRecords: memoryLimit,
+            deadline: startTime + maxExecutionTime,
+            // Imports are usually many pages - start at full parallelism, no ramp-up
+            initialBatchSize: Config.getMaxParallelRequests(),
+          },
+        );
 
-          // Update pagination state
-          page += pagesToFetch;
-          pagesProcessed += pagesToFetch;
+        allData = pages.data;
+        totalRecords = allData.length;
+        pagesProcessed = pages.pagesRead;
 
-          // Stop if we detected end of data
-          if (shouldStopPagination || !batchHasData) {
-            hasNextPage = false;
-          }
+        if (pages.stopReason !== "end") {
+          Logger.log(
+            `⏰ Stopped before the end of data (${pages.stopReason} limit reached)`,
+          );
         }
       } else {
         // NON-PAGINATED ENDPOINTS: Single request
@@ -609,6 +513,9 @@ const ImportDialog = {
         };
       }
 
+      // Get update URL from config first - an unknown endpoint fails before any auth work
+      const updateUrl = Config.getUpdateUrl(endpoint);
+
       // Get token using centralized auth
       const authResult = AuthManager.authenticateRequest();
       if (!authResult.success) {
@@ -621,32 +528,20 @@ const ImportDialog = {
 
       const token = authResult.token;
 
-      // Get update URL from config
-      const updateUrl = Config.getUpdateUrl(endpoint);
-
       Logger.log(`Calling ${endpoint} update API: ${updateUrl}`);
-      Logger.log(`Full Payload:\n${JSON.stringify(payload, null, 2)}`);
+      Logger.log(`Payload preview: ${Utils.previewForLog(payload, 500)}`);
 
-      for (let attempt = 1; attempt <= Config.getMaxRetries(); attempt++) {
-        try {
-          const response = UrlFetchApp.fetch(updateUrl, {
-            method: "POST",
-            headers: {
-              "Content-Type": "application/json",
-              Authorization: `Bearer ${token}`,
-              "User-Agent":
-                "Mozilla/5.0 (Macintosh; Intel Mac OS X 10_15_7) AppleWebKit/537.36 (KHTML, like Gecko) Chrome/135.0.0.0 Safari/537.36",
-              Referer: "https://app-qa.zono.digital/",
-              "sec-ch-ua":
-                '"Google Chrome";v="135", "Not-A.Brand";v="8", "Chromium";v="135"',
-              "sec-ch-ua-mobile": "?0",
-              "sec-ch-ua-platform": '"macOS"',
-            },
-            payload: JSON.stringify(payload),
-            muteHttpExceptions: true,
-            timeout: Config.getTimeout(),
-          });
+      // Build the request once; updates are sent once and never retried
+      const requestOptions = {
+        method: "POST",
+        headers: HttpClient.updateHeaders(token),
+        payload: JSON.stringify(payload),
+      };
 
+      return HttpClient.fetchWithRetry(
+        updateUrl,
+        requestOptions,
+        (response) => {
           const responseCode = response.getResponseCode();
           const responseText = response.getContentText();
 
@@ -674,29 +569,20 @@ const ImportDialog = {
             };
           } else if (responseCode === 401) {
             throw new Error(
-              `Authentication failed (${responseCode}): ${responseText}`,
+              `Authentication failed (${responseCode}): ${Utils.truncateText(responseText)}`,
             );
           } else if (responseCode === 400) {
             throw new Error(
-              `Bad request - invalid payload (${responseCode}): ${responseText}`,
+              `Bad request - invalid payload (${responseCode}): ${Utils.truncateText(responseText)}`,
             );
           } else {
             throw new Error(
-              `${endpoint} Update API request failed (${responseCode}): ${responseText}`,
+              `${endpoint} Update API request failed (${responseCode}): ${Utils.truncateText(responseText)}`,
             );
           }
-        } catch (error) {
-          Logger.log(
-            `${endpoint} Update API attempt ${attempt} failed: ${error.message}`,
-          );
-
-          if (attempt < Config.getMaxRetries()) {
-            Utilities.sleep(Config.getRetryDelay() * Math.pow(2, attempt - 1));
-          } else {
-            throw error;
-          }
-        }
-      }
+        },
+        `${endpoint} Update API`,
+      );
     } catch (error) {
       Logger.log(`❌ Error updating ${endpoint}: ${error.message}`);
       return {
@@ -874,96 +760,45 @@ const ImportDialog = {
       const headerIndex = {};
       headers.forEach((h, i) => (headerIndex[h] = i));
 
+      // Resolve each API field to its sheet column and converter once, not once per row
+      const fieldPlan = [];
+      Object.keys(fieldTypes).forEach((apiField) => {
+        // Try exact match first, then case-insensitive match
+        let mappingKey = apiField;
+        if (!mappingObj.hasOwnProperty(apiField)) {
+          // Try case-insensitive lookup
+          const normalizedApiField = normalizeFieldName(apiField);
+          if (normalizedMappingIndex.hasOwnProperty(normalizedApiField)) {
+            mappingKey = normalizedMappingIndex[normalizedApiField];
+            Logger.log(`Case-insensitive match: "${apiField}" -> "${mappingKey}"`);
+          } else {
+            mappingKey = null;
+          }
+        }
+
+        // Unmapped fields are left out of the record entirely
+        if (mappingKey && mappingObj.hasOwnProperty(mappingKey)) {
+          const sheetColumn = mappingObj[mappingKey];
+          fieldPlan.push({
+            apiField: apiField,
+            columnIndex: headerIndex[sheetColumn] ?? -1,
+            converter: UploadSchemas.getFieldConverter(fieldTypes[apiField]),
+          });
+        }
+      });
+
       // Apply mappings and type conversion
       const mappedRecords = dataRows.map((row) => {
         const record = {};
 
-        Object.keys(fieldTypes).forEach((apiField) => {
-          // Try exact match first, then case-insensitive match
-          let mappingKey = apiField;
-          if (!mappingObj.hasOwnProperty(apiField)) {
-            // Try case-insensitive lookup
-            const normalizedApiField = normalizeFieldName(apiField);
-            if (normalizedMappingIndex.hasOwnProperty(normalizedApiField)) {
-              mappingKey = normalizedMappingIndex[normalizedApiField];
-              Logger.log(`Case-insensitive match: "${apiField}" -> "${mappingKey}"`);
-            } else {
-              mappingKey = null;
-            }
-          }
+        fieldPlan.forEach(({ apiField, columnIndex, converter }) => {
+          const value = columnIndex !== -1 ? row[columnIndex] : "";
 
-          if (mappingKey && mappingObj.hasOwnProperty(mappingKey)) {
-            const sheetColumn = mappingObj[mappingKey];
-            const columnIndex = headerIndex[sheetColumn] ?? -1;
-
-            if (columnIndex !== -1) {
-              let value = row[columnIndex];
-              const fieldType = fieldTypes[apiField];
-
-              // Type conversion based on field type
-              if (value === null || value === undefined || value === "") {
-                // Handle empty values based on type
-                if (fieldType === "array") {
-                  record[apiField] = [];
-                } else if (fieldType === "number") {
-                  record[apiField] = 0;
-                } else if (fieldType === "boolean") {
-                  record[apiField] = false;
-                } else {
-                  record[apiField] = "";
-                }
-              } else {
-                // Convert to appropriate type
-                if (fieldType === "string") {
-                  record[apiField] = String(value).trim();
-                } else if (fieldType === "number") {
-                  const numValue = parseFloat(value);
-                  record[apiField] = isNaN(numValue) ? 0 : numValue;
-                } else if (fieldType === "boolean") {
-                  record[apiField] =
-                    value === true ||
-                    value === "true" ||
-                    value === 1 ||
-                    value === "1";
-                } else if (fieldType === "array") {
-                  // Parse array - JSON or comma-separated
-                  if (typeof value === "string") {
-                    value = value.trim();
-                    if (value.startsWith("[") || value.startsWith("{")) {
-                      // JSON format (complex nested structures)
-                      try {
-                        record[apiField] = JSON.parse(value);
-                      } catch (e) {
-                        Logger.log(
-                          `Failed to parse JSON for ${apiField}: ${e.message}`,
-                        );
-                        record[apiField] = [];
-                      }
-                    } else {
-                      // Comma-separated format (simple arrays)
-                      record[apiField] = value
-                        .split(",")
-                        .map((v) => v.trim())
-                        .filter((v) => v);
-                    }
-                  } else {
-                    record[apiField] = [String(value)];
-                  }
-                }
-              }
-            } else {
-              // Column not found - set defaults
-              if (fieldTypes[apiField] === "array") {
-                record[apiField] = [];
-              } else if (fieldTypes[apiField] === "number") {
-                record[apiField] = 0;
-              } else if (fieldTypes[apiField] === "boolean") {
-                record[apiField] = false;
-              } else {
-                record[apiField] = "";
-              }
-            }
-          }
+          // Empty cells and missing columns get the type's default value
+          record[apiField] =
+            value === null || value === undefined || value === ""
+              ? converter.empty()
+              : converter.convert(value, apiField);
         });
 
         return record;
@@ -1036,10 +871,6 @@ const ImportDialog = {
       // Build payload - endpoint name as key
       Logger.log(`✅ Built payload with ${mappedRecords.length} records`);
       const payload = { [endpoint]: mappedRecords };
-      const payloadPreview = JSON.stringify(payload);
-      Logger.log(
-        `Payload: ${payloadPreview.substring(0, 500)}${payloadPreview.length > 500 ? "..." : ""}`,
-      );
 
       // Make API call
       const result = this.updateEntity(endpoint, payload);
@@ -119,8 +119,8 @@ const MappingManager = {
       const spreadsheet = SpreadsheetApp.getActiveSpreadsheet();
       const currentSheets = spreadsheet.getSheets();
 
-      // Create map of existing sheet IDs
-      const existingSheetIds = new Set(currentSheets.map(sheet => sheet.getSheetId()));
+      // Map existing sheet IDs to names once instead of looking each sheet up again
+      const sheetNamesById = new Map(currentSheets.map(sheet => [sheet.getSheetId(), sheet.getName()]));
 
       const documentProperties = PropertiesService.getDocumentProperties();
       const allProperties = documentProperties.getProperties();
@@ -134,12 +134,11 @@ const MappingManager = {
           try {
             const data = JSON.parse(allProperties[key]);
 
-            const isOrphaned = !existingSheetIds.has(sheetId);
-            const sheet = isOrphaned ? null : this._getSheetById(sheetId);
+            const isOrphaned = !sheetNamesById.has(sheetId);
 
             sheetsWithMappings.push({
               sheetId: sheetId,
-              sheetName: sheet ? sheet.getName() : (data.sheetName || 'Unknown'),
+              sheetName: isOrphaned ? (data.sheetName || 'Unknown') : sheetNamesById.get(sheetId),
               endpoint: data.endpoint,
               period: data.period || 30,
               mappingCount: data.mappings ? Object.keys(data.mappings).length : 0,
@@ -170,18 +169,20 @@ const MappingManager = {
 
   /**
    * Scan and delete orphaned mappings (manual cleanup)
+   * Pass the sheet ID set and properties snapshot when the caller has already read them
    * Returns count of deleted orphaned mappings
    */
-  scanAndDeleteOrphanedMappings() {
+  scanAndDeleteOrphanedMappings(existingSheetIds = null, allProperties = null) {
     try {
-      const spreadsheet = SpreadsheetApp.getActiveSpreadsheet();
-      const currentSheets = spreadsheet.getSheets();
-
-      // Create map of existing sheet IDs
-      const existingSheetIds = new Set(currentSheets.map(sheet => sheet.getSheetId()));
+      if (!existingSheetIds) {
+        const currentSheets = SpreadsheetApp.getActiveSpreadsheet().getSheets();
+        existingSheetIds = new Set(currentSheets.map(sheet => sheet.getSheetId()));
+      }
 
       const documentProperties = PropertiesService.getDocumentProperties();
-      const allProperties = documentProperties.getProperties();
+      if (!allProperties) {
+        allProperties = documentProperties.getProperties();
+      }
 
       const orphanedMappings = [];
 
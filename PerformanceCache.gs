@@ -11,6 +11,7 @@ const PERFORMANCE_CACHE = {
   credentialsCacheTime: 0,
   tokenStatus: null,
   tokenStatusCacheTime: 0,
+  tokenData: null,
   lastTokenCheck: 0,
   validationResults: new Map()
 };
@@ -106,6 +107,28 @@ const PerformanceCache = {
     PERFORMANCE_CACHE.lastTokenCheck = 0;
   },
 
+  /**
+   * Get cached token record (parsed zotoks_cached_token)
+   * Expiry and version are checked by the caller against the record itself
+   */
+  getCachedToken() {
+    return PERFORMANCE_CACHE.tokenData;
+  },
+
+  /**
+   * Set cached token record
+   */
+  setCachedToken(tokenData) {
+    PERFORMANCE_CACHE.tokenData = tokenData;
+  },
+
+  /**
+   * Clear cached token record
+   */
+  clearCachedToken() {
+    PERFORMANCE_CACHE.tokenData = null;
+  },
+
   /**
    * Check token check cooldown
    */
@@ -125,8 +148,9 @@ const PerformanceCache = {
    * Get cached validation result
    */
   getCachedValidationResult(key) {
-    if (PERFORMANCE_CACHE.validationResults.has(key)) {
-      const cachedResult = PERFORMANCE_CACHE.validationResults.get(key);
+    // Single lookup - a miss returns undefined instead of a has()/get() pair
+    const cachedResult = PERFORMANCE_CACHE.validationResults.get(key);
+    if (cachedResult) {
       if (this.isCacheValid(cachedResult.timestamp)) {
         return cachedResult.result;
       } else {
@@ -154,8 +178,9 @@ const PerformanceCache = {
       // Clear credentials cache
       this.clearCachedCredentials();
 
-      // Clear token status cache
+      // Clear token status and token record caches
       this.clearCachedTokenStatus();
+      this.clearCachedToken();
 
       // Clear all validation results
       PERFORMANCE_CACHE.validationResults.clear();
@@ -2,6 +2,18 @@
 // PRICELISTDIALOG.GS - PRICE LIST DIALOG API AND UPLOAD LOGIC
 // ==========================================
 
+/**
+ * Normalized sheet header -> price list product field, used when syncing
+ */
+const PRICE_LIST_HEADER_FIELDS = {
+  sku: 'sku',
+  productsku: 'sku',
+  price: 'price',
+  unitprice: 'price',
+  pricewithmargin: 'priceWithMargin',
+  marginprice: 'priceWithMargin'
+};
+
 /**
  * Price List dialog-specific API functions and upload logic
  * Handles all price list operations including fetching, importing, and syncing
@@ -28,86 +40,43 @@ const PricelistDialog = {
 
       const token = authResult.token;
 
-      // Get endpoint config
-      const endpointConfig = Config.getPriceListEndpointConfig('pricelist');
       const pageSize = Config.getPageSize();
-
-      let allData = [];
-      let page = 1;
-      let hasNextPage = true;
+      const requestHeaders = HttpClient.authHeaders(token);
 
       Logger.log(`📏 Starting pagination with page size: ${pageSize}`);
 
-      // Pagination loop
-      while (hasNextPage) {
-        const priceListUrl = Config.buildPriceListUrl('pricelist', { pageNo: page });
-        Logger.log(`Fetching page ${page}: ${priceListUrl}`);
-
-        for (let attempt = 1; attempt <= Config.getMaxRetries(); attempt++) {
-          try {
-            const response = UrlFetchApp.fetch(priceListUrl, {
-              method: 'GET',
-              headers: {
-                'Content-Type': 'application/json',
-                'Authorization': `Bearer ${token}`
-              },
-              muteHttpExceptions: true,
-              timeout: Config.getTimeout()
-            });
-
-            const responseCode = response.getResponseCode();
-            const responseText = response.getContentText();
-
-            Logger.log(`Page ${page} Response - Code: ${responseCode}`);
-
-            if (responseCode >= 200 && responseCode < 300) {
-              const apiResponse = JSON.parse(responseText);
-
-              // Extract data from response
-              let pageData = [];
-              if (apiResponse.data && Array.isArray(apiResponse.data)) {
-                pageData = apiResponse.data;
-              } else if (Array.isArray(apiResponse)) {
-                pageData = apiResponse;
-              }
-
-              Logger.log(`📋 Page ${page}: ${pageData.length} records`);
-
-              if (pageData.length > 0) {
-                allData = allData.concat(pageData);
-              }
+      const pages = HttpClient.fetchPages(
+        pageNo => Config.buildPriceListUrl('pricelist', { pageNo }),
+        { method: 'GET', headers: requestHeaders },
+        (response, pageNo) => {
+          const responseCode = response.getResponseCode();
+          const responseText = response.getContentText();
 
-              // Check if there's more data
-              hasNextPage = pageData.length === pageSize;
-              page++;
+          Logger.log(`Page ${pageNo} Response - Code: ${responseCode}`);
 
-              break; // Success, exit retry loop
+          if (responseCode >= 200 && responseCode < 300) {
+            const apiResponse = JSON.parse(responseText);
 
-            } else if (responseCode === 401) {
-              throw new Error(`Authentication failed (${responseCode}): ${responseText}`);
-            } else {
-              throw new Error(`Price Lists API request failed (${responseCode}): ${responseText}`);
+            // Extract data from response
+            if (apiResponse.data && Array.isArray(apiResponse.data)) {
+              return apiResponse.data;
+            } else if (Array.isArray(apiResponse)) {
+              return apiResponse;
             }
+            return [];
 
-          } catch (error) {
-            Logger.log(`Page ${page} attempt ${attempt} failed: ${error.message}`);
-
-            if (attempt < Config.getMaxRetries()) {
-              Utilities.sleep(Config.getRetryDelay() * Math.pow(2, attempt - 1));
-            } else {
-              throw error;
-            }
+          } else if (responseCode === 401) {
+            throw new Error(`Authentication failed (${responseCode}): ${Utils.truncateText(responseText)}`);
+          } else {
+            throw new Error(`Price Lists API request failed (${responseCode}): ${Utils.truncateText(responseText)}`);
           }
-        }
-
-        // Small delay between pages
-        if (hasNextPage) {
-          Utilities.sleep(Config.getPageProcessingDelay());
-        }
-      }
+        },
+        { pageSize }
+      );
+      const allData = pages.data;
 
       const executionTime = Date.now() - startTime;
-      Logger.log(`✅ Completed: ${allData.length} total price lists, ${page - 1} pages, ${executionTime}ms`);
+      Logger.log(`✅ Completed: ${allData.length} total price lists, ${pages.pagesRead} pages, ${executionTime}ms`);
 
       return {
         success: true,
@@ -128,8 +97,10 @@ const PricelistDialog = {
 
   /**
    * Get price list items with pagination support
+   * Pass a token to reuse one authentication across several price lists, and a deadline
+   * (epoch ms) to share one execution time budget across them
    */
-  getPriceListItems(priceListId) {
+  getPriceListItems(priceListId, token = null, deadline = null) {
     try {
       Logger.log(`🏷️ Fetching price list items for ID: ${priceListId} with pagination...`);
       const startTime = Date.now();
@@ -141,113 +112,86 @@ const PricelistDialog = {
         };
       }
 
-      // Get token using centralized auth
-      const authResult = AuthManager.authenticateRequest();
-      if (!authResult.success) {
-        return {
-          success: false,
-          message: authResult.message,
-          needsCredentials: authResult.needsCredentials
-        };
+      // Get token using centralized auth unless the caller already has one
+      if (!token) {
+        const authResult = AuthManager.authenticateRequest();
+        if (!authResult.success) {
+          return {
+            success: false,
+            message: authResult.message,
+            needsCredentials: authResult.needsCredentials
+          };
+        }
+        token = authResult.token;
       }
 
-      const token = authResult.token;
-
-      // Get endpoint config
-      const endpointConfig = Config.getPriceListEndpointConfig('pricelist-items');
       const pageSize = Config.getPageSize();
+      const requestHeaders = HttpClient.authHeaders(token);
 
-      let allData = [];
       let headers = null;
-      let page = 1;
-      let hasNextPage = true;
 
       Logger.log(`📏 Starting pagination with page size: ${pageSize}`);
 
-      // Pagination loop
-      while (hasNextPage) {
-        const itemsUrl = Config.buildPriceListUrl('pricelist-items', { priceListId, pageNo: page });
-        Logger.log(`Fetching page ${page}: ${itemsUrl}`);
-
-        for (let attempt = 1; attempt <= Config.getMaxRetries(); attempt++) {
-          try {
-            const response = UrlFetchApp.fetch(itemsUrl, {
-              method: 'GET',
-              headers: {
-                'Content-Type': 'application/json',
-                'Authorization': `Bearer ${token}`
-              },
-              muteHttpExceptions: true,
-              timeout: Config.getTimeout()
-            });
-
-            const responseCode = response.getResponseCode();
-            const responseText = response.getContentText();
-
-            Logger.log(`Page ${page} Response - Code: ${responseCode}`);
-
-            if (responseCode >= 200 && responseCode < 300) {
-              const apiResponse = JSON.parse(responseText);
-
-              // Extract headers on first page
-              if (page === 1 && apiResponse.headers) {
-                headers = apiResponse.headers;
-              }
-
-              // Extract data from response
-              let pageData = [];
-              if (apiResponse.data) {
-                if (Array.isArray(apiResponse.data)) {
-                  pageData = apiResponse.data;
-                } else if (apiResponse.data.data && Array.isArray(apiResponse.data.data)) {
-                  pageData = apiResponse.data.data;
-                }
-              } else if (Array.isArray(apiResponse)) {
-                pageData = apiResponse;
-              }
+      const pages = HttpClient.fetchPages(
+        pageNo => Config.buildPriceListUrl('pricelist-items', { priceListId, pageNo }),
+        { method: 'GET', headers: requestHeaders },
+        (response, pageNo) => {
+          const responseCode = response.getResponseCode();
+          const responseText = response.getContentText();
 
-              Logger.log(`📋 Page ${page}: ${pageData.length} records`);
+          Logger.log(`Page ${pageNo} Response - Code: ${responseCode}`);
 
-              if (pageData.length > 0) {
-                allData = allData.concat(pageData);
-              }
+          if (responseCode >= 200 && responseCode < 300) {
+            const apiResponse = JSON.parse(responseText);
 
-              // Check if there's more data
-              hasNextPage = pageData.length === pageSize;
-              page++;
-
-              break; // Success, exit retry loop
-
-            } else if (responseCode === 401) {
-              throw new Error(`Authentication failed (${responseCode}): ${responseText}`);
-            } else if (responseCode === 404) {
-              return {
-                success: false,
-                message: `Price list not found: ${priceListId}`
-              };
-            } else {
-              throw new Error(`Price List Items API request failed (${responseCode}): ${responseText}`);
+            // Extract headers on first page
+            if (pageNo === 1 && apiResponse.headers) {
+              headers = apiResponse.headers;
             }
 
-          } catch (error) {
-            Logger.log(`Page ${page} attempt ${attempt} failed: ${error.message}`);
-
-            if (attempt < Config.getMaxRetries()) {
-              Utilities.sleep(Config.getRetryDelay() * Math.pow(2, attempt - 1));
-            } else {
-              throw error;
+            // Extract data from response
+            if (apiResponse.data) {
+              if (Array.isArray(apiResponse.data)) {
+                return apiResponse.data;
+              } else if (apiResponse.data.data && Array.isArray(apiResponse.data.data)) {
+                return apiResponse.data.data;
+              }
+            } else if (Array.isArray(apiResponse)) {
+              return apiResponse;
             }
+            return [];
+
+          } else if (responseCode === 401) {
+            throw new Error(`Authentication failed (${responseCode}): ${Utils.truncateText(responseText)}`);
+          } else if (responseCode === 404) {
+            // Not retried - on page 1 the price list doesn't exist, later it's the end of data
+            Logger.log(`📄 Page ${pageNo} returned 404`);
+            return null;
+          } else {
+            throw new Error(`Price List Items API request failed (${responseCode}): ${Utils.truncateText(responseText)}`);
           }
-        }
+        },
+        { pageSize, deadline }
+      );
 
-        // Small delay between pages
-        if (hasNextPage) {
-          Utilities.sleep(Config.getPageProcessingDelay());
-        }
+      // Fail rather than return a partial price list
+      if (pages.stopReason === 'deadline') {
+        return {
+          success: false,
+          message: `Time limit reached after ${pages.pagesRead} pages - run again to continue`
+        };
+      }
+      if (pages.pagesRead === 0) {
+        return {
+          success: false,
+          message: `Price list not found: ${priceListId}`
+        };
       }
 
+      const allData = pages.data;
+
       const executionTime = Date.now() - startTime;
-      Logger.log(`✅ Completed: ${allData.length} total items, ${page - 1} pages, ${executionTime}ms`);
+      Logger.log(`✅ Completed: ${allData.length} total items, ${pages.pagesRead} pages, ${executionTime}ms`);
 
       // Return in format expected by existing code
       const itemsData = {
@@ -312,26 +256,19 @@ const PricelistDialog = {
       const updateUrl = Config.buildPriceListUrl('pricelist-update');
 
       Logger.log(`Calling price list update API: ${updateUrl}`);
-      Logger.log(`Full Payload:\n${JSON.stringify(payload, null, 2)}`);
-
-      for (let attempt = 1; attempt <= Config.getMaxRetries(); attempt++) {
-        try {
-          const response = UrlFetchApp.fetch(updateUrl, {
-            method: 'POST',
-            headers: {
-              'Content-Type': 'application/json',
-              'Authorization': `Bearer ${token}`,
-              'User-Agent': 'Mozilla/5.0 (Macintosh; Intel Mac OS X 10_15_7) AppleWebKit/537.36 (KHTML, like Gecko) Chrome/135.0.0.0 Safari/537.36',
-              'Referer': 'https://app-qa.zono.digital/',
-              'sec-ch-ua': '"Google Chrome";v="135", "Not-A.Brand";v="8", "Chromium";v="135"',
-              'sec-ch-ua-mobile': '?0',
-              'sec-ch-ua-platform': '"macOS"'
-            },
-            payload: JSON.stringify(payload),
-            muteHttpExceptions: true,
-            timeout: Config.getTimeout()
-          });
+      Logger.log(`Payload preview: ${Utils.previewForLog(payload, 500)}`);
+
+      // Build the request once; updates are sent once and never retried
+      const requestOptions = {
+        method: 'POST',
+        headers: HttpClient.updateHeaders(token),
+        payload: JSON.stringify(payload)
+      };
 
+      return HttpClient.fetchWithRetry(
+        updateUrl,
+        requestOptions,
+        (response) => {
           const responseCode = response.getResponseCode();
           const responseText = response.getContentText();
 
@@ -360,23 +297,15 @@ const PricelistDialog = {
             };
 
           } else if (responseCode === 401) {
-            throw new Error(`Authentication failed (${responseCode}): ${responseText}`);
+            throw new Error(`Authentication failed (${responseCode}): ${Utils.truncateText(responseText)}`);
           } else if (responseCode === 400) {
-            throw new Error(`Bad request - invalid payload (${responseCode}): ${responseText}`);
-          } else {
-            throw new Error(`Price List Update API request failed (${responseCode}): ${responseText}`);
-          }
-
-        } catch (error) {
-          Logger.log(`Price List Update API attempt ${attempt} failed: ${error.message}`);
-
-          if (attempt < Config.getMaxRetries()) {
-            Utilities.sleep(Config.getRetryDelay() * Math.pow(2, attempt - 1));
+            throw new Error(`Bad request - invalid payload (${responseCode}): ${Utils.truncateText(responseText)}`);
           } else {
-            throw error;
+            throw new Error(`Price List Update API request failed (${responseCode}): ${Utils.truncateText(responseText)}`);
           }
-        }
-      }
+        },
+        'Price List Update API'
+      );
 
     } catch (error) {
       Logger.log(`❌ Error updating price list: ${error.message}`);
@@ -452,23 +381,26 @@ const PricelistDialog = {
 
       Logger.log(`Processing ${dataRows.length} rows with headers: ${JSON.stringify(headers)}`);
 
+      // Classify each header once - only sku/price columns are read per row
+      const columnPlan = [];
+      headers.forEach((header, index) => {
+        const cleanHeader = String(header).trim().toLowerCase().replace(/[\s_]/g, '');
+
+        if (PRICE_LIST_HEADER_FIELDS.hasOwnProperty(cleanHeader)) {
+          columnPlan.push({ index: index, field: PRICE_LIST_HEADER_FIELDS[cleanHeader] });
+        }
+      });
+
       const products = dataRows.map(row => {
         const product = {};
-        headers.forEach((header, index) => {
-          const cleanHeader = String(header).trim().toLowerCase().replace(/[\s_]/g, '');
-          let value = row[index];
+        columnPlan.forEach(({ index, field }) => {
+          const value = row[index];
 
           if (value === '' || value === null || value === undefined) {
             return;
           }
 
-          if (cleanHeader === 'sku' || cleanHeader === 'productsku') {
-            product.sku = String(value);
-          } else if (cleanHeader === 'price' || cleanHeader === 'unitprice') {
-            product.price = parseFloat(value) || 0;
-          } else if (cleanHeader === 'pricewithmargin' || cleanHeader === 'marginprice') {
-            product.priceWithMargin = parseFloat(value) || 0;
-          }
+          product[field] = field === 'sku' ? String(value) : parseFloat(value) || 0;
         });
         return product;
       }).filter(product => product.sku && String(product.sku).trim() !== '');
@@ -499,7 +431,6 @@ const PricelistDialog = {
         ]
       };
       Logger.log(`Constructed payload with ${products.length} products`);
-      Logger.log(`Full Payload:\n${JSON.stringify(payload, null, 2)}`);
 
       const result = this.updatePriceList(payload);
       if (result.success) {
@@ -2,6 +2,33 @@
 // SHEETMANAGER.GS - SHEET AND DATA MANAGEMENT (UPDATED WITH PRICE LIST SUPPORT)
 // ==========================================
 
+/**
+ * Header keywords used to locate price list columns
+ */
+const PRICE_COLUMN_KEYWORDS = [
+  "price",
+  "unitprice",
+  "unit_price",
+  "cost",
+  "amount",
+];
+
+const SKU_COLUMN_KEYWORDS = [
+  "sku",
+  "product_sku",
+  "productsku",
+  "product_code",
+  "productcode",
+  "item_code",
+  "itemcode",
+];
+
+const PRICE_FIELD_KEYWORDS = [
+  ...PRICE_COLUMN_KEYWORDS,
+  "pricewithmargin",
+  "marginprice",
+];
+
 /**
  * Sheet management utilities with Price List support
  */
@@ -267,9 +294,12 @@ const SheetManager = {
       }
 
       // *** ORIGINAL EXACT MATCH LOGIC ***
+      // Set lookups keep this linear in the column count
+      const sourceColumnSet = new Set(sourceColumns);
+      const targetColumnSet = new Set(targetColumns);
       const exactMatch =
-        sourceColumns.every((col) => targetColumns.includes(col)) &&
-        targetColumns.every((col) => sourceColumns.includes(col));
+        sourceColumns.every((col) => targetColumnSet.has(col)) &&
+        targetColumns.every((col) => sourceColumnSet.has(col));
 
       if (exactMatch && targetColumns.length > 0) {
         Logger.log(
@@ -339,11 +369,13 @@ const SheetManager = {
           );
 
           // Automatically import using the valid existing mappings
+          // Reuse the data fetched above instead of fetching every page again
           const importResult = this.importWithMappings(
             targetSheetName,
             endpoint,
             period,
             existingMappings.mappings,
+            dataResult,
           );
 
           if (importResult.success) {
@@ -396,17 +428,22 @@ const SheetManager = {
 
   /**
    * Import with mappings and enhanced performance
+   * Pass prefetchedData (a successful fetchData result) to skip fetching again
    */
-  /**
-   * Import with mappings and enhanced performance
-   */
-  importWithMappings(targetSheetName, endpoint, period, mappings) {
+  importWithMappings(
+    targetSheetName,
+    endpoint,
+    period,
+    mappings,
+    prefetchedData = null,
+  ) {
     try {
       Logger.log(
         `Importing ${endpoint} data with mappings to sheet: ${targetSheetName}`,
       );
-      // Fetch full data with caching
-      const dataResult = ImportDialog.fetchData(endpoint, period);
+      // Fetch full data unless the caller already has it
+      const dataResult =
+        prefetchedData || ImportDialog.fetchData(endpoint, period);
       if (!dataResult.success) {
         return dataResult;
       }
@@ -441,21 +478,16 @@ const SheetManager = {
 
       Logger.log("Using mappings:", JSON.stringify(mappingObj));
       // Get sheet headers
+      const lastRow = sheet.getLastRow();
+      const lastColumn = sheet.getLastColumn();
       let sheetHeaders = [];
-      if (sheet.getLastRow() > 0) {
-        sheetHeaders = sheet
-          .getRange(1, 1, 1, sheet.getLastColumn())
-          .getValues()[0];
+      if (lastRow > 0) {
+        sheetHeaders = sheet.getRange(1, 1, 1, lastColumn).getValues()[0];
       }
 
       // Always clear existing data before importing
-      if (sheet.getLastRow() > 1) {
-        const dataRange = sheet.getRange(
-          2,
-          1,
-          sheet.getLastRow() - 1,
-          sheet.getLastColumn(),
-        );
+      if (lastRow > 1) {
+        const dataRange = sheet.getRange(2, 1, lastRow - 1, lastColumn);
         dataRange.clearContent();
         SpreadsheetApp.flush(); // Force UI update to show cleared data
         Logger.log("Cleared existing data before import");
@@ -465,18 +497,24 @@ const SheetManager = {
       const headerIndex = {};
       sheetHeaders.forEach((h, i) => (headerIndex[h] = i));
 
+      // Resolve each mapping to a target column index once, not per record
+      const columnPairs = [];
+      Object.keys(mappingObj).forEach((sourceCol) => {
+        const targetIndex = headerIndex[mappingObj[sourceCol]] ?? -1;
+        if (targetIndex >= 0) {
+          columnPairs.push([sourceCol, targetIndex]);
+        }
+      });
+
       // Map the data according to column mappings
       const mappedRows = dataResult.data.map((record) => {
         const mappedRow = new Array(sheetHeaders.length).fill("");
 
-        Object.keys(mappingObj).forEach((sourceCol) => {
-          const targetCol = mappingObj[sourceCol];
-          const targetIndex = headerIndex[targetCol] ?? -1;
-
-          if (targetIndex >= 0 && record[sourceCol] !== undefined) {
+        for (const [sourceCol, targetIndex] of columnPairs) {
+          if (record[sourceCol] !== undefined) {
             mappedRow[targetIndex] = record[sourceCol];
           }
-        });
+        }
 
         return mappedRow;
       });
@@ -680,6 +718,17 @@ const SheetManager = {
       }
 
       Logger.log(`📋 Processing ${priceListsData.length} price lists`);
+      const deadline = Date.now() + Config.getMaxExecutionTime();
+
+      // Authenticate once for the whole run - an auth failure would fail every price list
+      const authResult = AuthManager.authenticateRequest();
+      if (!authResult.success) {
+        return {
+          success: false,
+          message: authResult.message,
+          needsCredentials: authResult.needsCredentials,
+        };
+      }
 
       const spreadsheet = SpreadsheetApp.getActiveSpreadsheet();
       const createdSheets = [];
@@ -690,6 +739,16 @@ const SheetManager = {
       for (let i = 0; i < priceListsData.length; i++) {
         const priceListInfo = priceListsData[i];
 
+        // Stop before Apps Script kills the execution mid-sheet
+        if (Date.now() > deadline) {
+          const skipped = priceListsData.length - i;
+          Logger.log(`⏰ Time limit reached, skipping ${skipped} remaining price lists`);
+          errors.push(
+            `Time limit reached - ${skipped} price lists not processed, run again to continue`,
+          );
+          break;
+        }
+
         try {
           Logger.log(
             `Processing price list ${i + 1}/${priceListsData.length}: ${priceListInfo.name}`,
@@ -730,7 +789,11 @@ const SheetManager = {
 
           // Get detailed items for this price list using correct ID
           Logger.log(`🔍 Fetching items for price list ID: ${priceListId}`);
-          const itemsResult = PricelistDialog.getPriceListItems(priceListId);
+          const itemsResult = PricelistDialog.getPriceListItems(
+            priceListId,
+            authResult.token,
+            deadline,
+          );
 
           if (!itemsResult.success) {
             Logger.log(
@@ -749,7 +812,7 @@ const SheetManager = {
 
           Logger.log(`✅ Successfully fetched items for ${priceListId}`);
           Logger.log(
-            `📊 Items data structure: ${JSON.stringify(itemsResult.data).substring(0, 200)}...`,
+            `📊 Items data structure: ${Utils.previewForLog(itemsResult.data, 200)}`,
           );
 
           // Import or compare the price list data
@@ -872,7 +935,7 @@ const SheetManager = {
     try {
       Logger.log(`📝 Importing price list data to sheet: ${sheet.getName()}`);
       Logger.log(
-        `📊 Raw price list data: ${JSON.stringify(priceListData).substring(0, 300)}...`,
+        `📊 Raw price list data: ${Utils.previewForLog(priceListData)}`,
       );
 
       if (!priceListData || typeof priceListData !== "object") {
@@ -1153,11 +1216,14 @@ const SheetManager = {
       const spreadsheet = SpreadsheetApp.getActiveSpreadsheet();
       const currentSheets = spreadsheet.getSheets();
 
-      // Create map of existing sheet IDs and names
-      const existingSheetIds = new Set(currentSheets.map(sheet => sheet.getSheetId()));
+      // Create maps of existing sheet IDs and names (one pass, no per-key sheet lookups)
+      const sheetNamesById = new Map();
       const sheetNameToId = {};
       currentSheets.forEach(sheet => {
-        sheetNameToId[sheet.getName()] = sheet.getSheetId();
+        const sheetId = sheet.getSheetId();
+        const sheetName = sheet.getName();
+        sheetNamesById.set(sheetId, sheetName);
+        sheetNameToId[sheetName] = sheetId;
       });
 
       const documentProperties = PropertiesService.getDocumentProperties();
@@ -1174,12 +1240,11 @@ const SheetManager = {
           try {
             const metadata = JSON.parse(allProperties[key]);
 
-            const isOrphaned = !existingSheetIds.has(sheetId);
-            const sheet = isOrphaned ? null : spreadsheet.getSheetById(sheetId);
+            const isOrphaned = !sheetNamesById.has(sheetId);
 
             priceListSheets.push({
               sheetId: sheetId,
-              sheetName: sheet ? sheet.getName() : (metadata.sheetName || 'Unknown'),
+              sheetName: isOrphaned ? (metadata.sheetName || 'Unknown') : sheetNamesById.get(sheetId),
               priceListName: metadata.priceListName,
               priceListId: metadata.priceListId,
               priceListCode: metadata.priceListCode,
@@ -1267,7 +1332,7 @@ const SheetManager = {
         `🔍 Comparing price list data to existing sheet: ${sheet.getName()}`,
       );
       Logger.log(
-        `📊 Raw price list data: ${JSON.stringify(priceListData).substring(0, 300)}...`,
+        `📊 Raw price list data: ${Utils.previewForLog(priceListData)}`,
       );
 
       if (!priceListData || typeof priceListData !== "object") {
@@ -1500,16 +1565,9 @@ const SheetManager = {
    * Helper: Find price column index in headers
    */
   findPriceColumnIndex(headers) {
-    const priceKeywords = [
-      "price",
-      "unitprice",
-      "unit_price",
-      "cost",
-      "amount",
-    ];
     for (let i = 0; i < headers.length; i++) {
       const header = String(headers[i]).toLowerCase().trim();
-      for (const keyword of priceKeywords) {
+      for (const keyword of PRICE_COLUMN_KEYWORDS) {
         if (header.includes(keyword)) {
           return i;
         }
@@ -1522,21 +1580,12 @@ const SheetManager = {
    * Helper: Find SKU column index in headers
    */
   findSKUColumnIndex(headers) {
-    const skuKeywords = [
-      "sku",
-      "product_sku",
-      "productsku",
-      "product_code",
-      "productcode",
-      "item_code",
-      "itemcode",
-    ];
     for (let i = 0; i < headers.length; i++) {
       const header = String(headers[i])
         .toLowerCase()
         .trim()
         .replace(/[\s_]/g, "");
-      for (const keyword of skuKeywords) {
+      for (const keyword of SKU_COLUMN_KEYWORDS) {
         if (header === keyword || header.includes(keyword)) {
           return i;
         }
@@ -1550,20 +1599,11 @@ const SheetManager = {
    */
   isPriceColumn(columnName) {
     if (!columnName) return false;
-    const priceKeywords = [
-      "price",
-      "unitprice",
-      "unit_price",
-      "cost",
-      "amount",
-      "pricewithmargin",
-      "marginprice",
-    ];
     const cleanName = String(columnName)
       .toLowerCase()
       .trim()
       .replace(/[\s_]/g, "");
-    return priceKeywords.some((keyword) => cleanName.includes(keyword));
+    return PRICE_FIELD_KEYWORDS.some((keyword) => cleanName.includes(keyword));
   },
 
   /**
@@ -1633,14 +1673,16 @@ const SheetManager = {
       // Check if all mapped source columns still exist
       const missingSourceColumns = [];
       const missingTargetColumns = [];
+      const sourceColumnSet = new Set(sourceColumns);
+      const targetColumnSet = new Set(targetColumns);
 
       Object.keys(mappings).forEach((sourceCol) => {
-        if (!sourceColumns.includes(sourceCol)) {
+        if (!sourceColumnSet.has(sourceCol)) {
           missingSourceColumns.push(sourceCol);
         }
 
         const targetCol = mappings[sourceCol];
-        if (targetCol && !targetColumns.includes(targetCol)) {
+        if (targetCol && !targetColumnSet.has(targetCol)) {
           missingTargetColumns.push(targetCol);
         }
       });
@@ -1691,6 +1733,10 @@ const SheetManager = {
       const existingFormulas = targetRange.getFormulas();
 
       // Create a new batch that preserves formulas
+      // Log a few examples and a total - a formula column would otherwise log every row
+      const maxLoggedFormulas = 5;
+      let preservedCount = 0;
+
       const formulaSafeBatch = batch.map((row, rowIndex) => {
         return row.map((cellValue, colIndex) => {
           const existingFormula =
@@ -1698,9 +1744,12 @@ const SheetManager = {
 
           // If there's a formula in this cell, preserve it instead of overwriting
           if (existingFormula && existingFormula.trim().startsWith("=")) {
-            Logger.log(
-              `🔒 Preserving formula in cell ${String.fromCharCode(65 + colIndex)}${startRow + rowIndex}: ${existingFormula}`,
-            );
+            preservedCount++;
+            if (preservedCount <= maxLoggedFormulas) {
+              Logger.log(
+                `🔒 Preserving formula in cell ${String.fromCharCode(65 + colIndex)}${startRow + rowIndex}: ${existingFormula}`,
+              );
+            }
             return existingFormula; // Keep the existing formula
           } else {
             return cellValue; // Use the new data value
@@ -1712,7 +1761,7 @@ const SheetManager = {
       targetRange.setValues(formulaSafeBatch);
 
       Logger.log(
-        `✅ Formula-safe batch imported: ${batch.length} rows processed`,
+        `✅ Formula-safe batch imported: ${batch.length} rows processed, ${preservedCount} formulas preserved`,
       );
     } catch (error) {
       Logger.log(`❌ Error in formula-safe batch import: ${error.message}`);
@@ -78,15 +78,82 @@ const UPLOAD_SCHEMAS = {
   // trips: { ... },
 };
 
+// Schemas are read-only lookup tables - freeze them and list the endpoints once
+Object.values(UPLOAD_SCHEMAS).forEach((schema) => Object.freeze(schema));
+Object.freeze(UPLOAD_SCHEMAS);
+
+const UPLOAD_SCHEMA_ENDPOINTS = Object.freeze(Object.keys(UPLOAD_SCHEMAS));
+
+/**
+ * Sheet-cell converters for each field type.
+ * Each entry returns the empty-cell default and converts a non-empty cell value.
+ */
+const FIELD_TYPE_CONVERTERS = {
+  string: {
+    empty: () => "",
+    convert: (value) => String(value).trim(),
+  },
+
+  number: {
+    empty: () => 0,
+    convert: (value) => {
+      const numValue = parseFloat(value);
+      return isNaN(numValue) ? 0 : numValue;
+    },
+  },
+
+  boolean: {
+    empty: () => false,
+    convert: (value) =>
+      value === true || value === "true" || value === 1 || value === "1",
+  },
+
+  array: {
+    empty: () => [],
+    convert: (value, fieldName) => {
+      // Parse array - JSON or comma-separated
+      if (typeof value !== "string") {
+        return [String(value)];
+      }
+
+      value = value.trim();
+      if (value.startsWith("[") || value.startsWith("{")) {
+        // JSON format (complex nested structures)
+        try {
+          return JSON.parse(value);
+        } catch (e) {
+          Logger.log(`Failed to parse JSON for ${fieldName}: ${e.message}`);
+          return [];
+        }
+      }
+
+      // Comma-separated format (simple arrays)
+      return value
+        .split(",")
+        .map((v) => v.trim())
+        .filter((v) => v);
+    },
+  },
+};
+
 /**
  * Get field types schema for an endpoint
  */
 const UploadSchemas = {
   getSchema(endpoint) {
-    return UPLOAD_SCHEMAS[endpoint] || null;
+    return UPLOAD_SCHEMAS.hasOwnProperty(endpoint) ? UPLOAD_SCHEMAS[endpoint] : null;
+  },
+
+  /**
+   * Get the cell converter for a field type (unknown types are treated as strings)
+   */
+  getFieldConverter(fieldType) {
+    return FIELD_TYPE_CONVERTERS.hasOwnProperty(fieldType)
+      ? FIELD_TYPE_CONVERTERS[fieldType]
+      : FIELD_TYPE_CONVERTERS.string;
   },
 
   getAvailableEndpoints() {
-    return Object.keys(UPLOAD_SCHEMAS);
+    return UPLOAD_SCHEMA_ENDPOINTS;
   },
 };
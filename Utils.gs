@@ -107,36 +107,31 @@ const Utils = {
    */
   scanAndDeleteOrphanedMappings() {
     try {
-      // Delete orphaned import mappings
-      const mappingResult = MappingManager.scanAndDeleteOrphanedMappings();
-      const mappingCount = mappingResult.success ? mappingResult.deletedCount : 0;
-
-      // Delete orphaned price list metadata (both ID-based and name-based)
-      const spreadsheet = SpreadsheetApp.getActiveSpreadsheet();
-      const currentSheets = spreadsheet.getSheets();
+      // Read sheets and properties once for both scans
+      const currentSheets = SpreadsheetApp.getActiveSpreadsheet().getSheets();
       const existingSheetIds = new Set(currentSheets.map(sheet => sheet.getSheetId()));
       const existingSheetNames = new Set(currentSheets.map(sheet => sheet.getName()));
 
       const documentProperties = PropertiesService.getDocumentProperties();
       const allProperties = documentProperties.getProperties();
 
-      const orphanedPriceLists = [];
+      // Delete orphaned import mappings
+      const mappingResult = MappingManager.scanAndDeleteOrphanedMappings(existingSheetIds, allProperties);
+      const mappingCount = mappingResult.success ? mappingResult.deletedCount : 0;
 
-      // Check ID-based price list metadata
+      // Delete orphaned price list metadata (both ID-based and name-based)
+      const orphanedPriceLists = [];
       const idBasedPrefix = 'zotoks_pricelist_meta_id_';
+      const nameBasedPrefix = Config.getPriceListMetadataKey('');
+
       Object.keys(allProperties).forEach(key => {
         if (key.startsWith(idBasedPrefix)) {
           const sheetId = parseInt(key.replace(idBasedPrefix, ''));
           if (!existingSheetIds.has(sheetId)) {
             orphanedPriceLists.push(key);
           }
-        }
-      });
-
-      // Check old name-based price list metadata
-      const nameBasedPrefix = Config.getPriceListMetadataKey('');
-      Object.keys(allProperties).forEach(key => {
-        if (key.startsWith(nameBasedPrefix) && !key.includes('_id_')) {
+        } else if (key.startsWith(nameBasedPrefix) && !key.includes('_id_')) {
+          // Old name-based metadata
           const sheetName = key.replace(nameBasedPrefix, '');
           if (!existingSheetNames.has(sheetName)) {
             orphanedPriceLists.push(key);
@@ -248,5 +243,42 @@ const Utils = {
     }
 
     return sanitized;
+  },
+
+  /**
+   * Cap a response body for use in error messages
+   * Error pages can be large; callers only need the start of the body
+   *
+   * @param {string} text - The text to cap
+   * @param {number} maxLength - Maximum length (default: 500)
+   * @returns {string} - The text, truncated with "..." if longer than maxLength
+   */
+  truncateText(text, maxLength = 500) {
+    const value = String(text);
+    return value.length > maxLength ? value.substring(0, maxLength) + '...' : value;
+  },
+
+  /**
+   * Short JSON preview of a value for logging
+   * Arrays are sampled before serializing, so large payloads are never stringified in full
+   *
+   * @param {any} value - The value to preview
+   * @param {number} maxLength - Maximum preview length (default: 300)
+   * @returns {string} - Truncated JSON preview
+   */
+  previewForLog(value, maxLength = 300) {
+    try {
+      const preview = JSON.stringify(value, (key, item) =>
+        Array.isArray(item) && item.length > 3
+          ? [...item.slice(0, 3), `... ${item.length - 3} more`]
+          : item
+      );
+      if (preview === undefined) {
+        return String(value);
+      }
+      return preview.length > maxLength ? preview.substring(0, maxLength) + '...' : preview;
+    } catch (error) {
+      return '[Unserializable value]';
+    }
   }
 };
\ No newline at end of file
@@ -137,26 +137,7 @@ function createZotoksMenuSafely() {
  */
 function showZotoksImportDialog() {
   try {
-    // Check if credentials are configured (lazy loading)
-    if (!AuthManager.hasCredentials()) {
-      UIManager.showCredentialsDialog();
-      return;
-    }
-
-    // Test basic authentication before showing main dialog (lazy loading)
-    const connectionTest = ImportDialog.testConnection();
-    if (!connectionTest.success) {
-      if (connectionTest.needsCredentials) {
-        UIManager.showCredentialsDialog();
-        return;
-      } else {
-        // Show credentials dialog with error context
-        UIManager.showCredentialsDialog();
-        return;
-      }
-    }
-
-    // Show main import dialog
+    // Show main import dialog (UIManager checks credentials and connection first)
     UIManager.showImportDialog();
   } catch (error) {
     Logger.log(`Error showing import dialog: ${error.message}`);
@@ -200,25 +181,7 @@ function showOrderImportDialog() {
  */
 function showZotoksPriceListDialog() {
   try {
-    // Check if credentials are configured
-    if (!AuthManager.hasCredentials()) {
-      UIManager.showCredentialsDialog();
-      return;
-    }
-
-    // Test basic authentication before showing dialog
-    const connectionTest = ImportDialog.testConnection();
-    if (!connectionTest.success) {
-      if (connectionTest.needsCredentials) {
-        UIManager.showCredentialsDialog();
-        return;
-      } else {
-        UIManager.showCredentialsDialog();
-        return;
-      }
-    }
-
-    // Show price list dialog
+    // Show price list dialog (UIManager checks credentials and connection first)
     UIManager.showPriceListDialog();
   } catch (error) {
     Logger.log(`Error showing price list dialog: ${error.message}`);
@@ -315,6 +278,15 @@ function syncCurrentPriceListSheet() {
 // CENTRALIZED DISPATCHER
 // ==========================================
 
+/**
+ * Legacy export actions pinned to a fixed upload endpoint
+ * Other export actions take the endpoint from the payload
+ */
+const EXPORT_ACTION_ENDPOINTS = {
+  exportCustomersWithMappings: "customers",
+  exportProductsWithMappings: "products",
+};
+
 /**
  * Central dispatch function - single entry point for all client-side calls
  * This replaces all individual wrapper functions
@@ -326,8 +298,7 @@ function syncCurrentPriceListSheet() {
 function dispatch(action, payload) {
   try {
     Logger.log(
-      `Dispatcher: ${action} called with payload:`,
-      JSON.stringify(payload),
+      `Dispatcher: ${action} called with payload: ${Utils.previewForLog(payload)}`,
     );
 
     // Normalize payload - handle cases where it might be wrapped
@@ -447,6 +418,14 @@ function dispatch(action, payload) {
       case "exportEntity":
       case "exportCustomersWithMappings":
       case "exportProductsWithMappings": {
+        // Resolve the endpoint first so cheap checks run before any auth work
+        const endpoint = EXPORT_ACTION_ENDPOINTS[action] || params.endpoint;
+
+        // Unknown endpoints fail on the schema lookup (exportEntity reports it)
+        if (!UploadSchemas.getSchema(endpoint)) {
+          return ImportDialog.exportEntity(endpoint, params.mappings || null);
+        }
+
         // Unified auth check for all export actions
         if (!AuthManager.hasCredentials()) {
           UIManager.showCredentialsDialog();
@@ -472,10 +451,6 @@ function dispatch(action, payload) {
         }
 
         // Route to exportEntity with correct endpoint
-        let endpoint = params.endpoint;
-        if (action === "exportCustomersWithMappings") endpoint = "customers";
-        if (action === "exportProductsWithMappings") endpoint = "products";
-
         return ImportDialog.exportEntity(endpoint, params.mappings || null);
       }
 